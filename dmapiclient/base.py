@@ -1,5 +1,8 @@
 from enum import Enum
+import http.cookiejar
 import logging
+import os
+import threading
 import time
 from typing import Optional
 import requests
@@ -33,16 +36,12 @@ def make_iter_method(method_name, *model_names):
         if not model_name:
             return
 
-        for model in result[model_name]:
-            yield model
-
-        while True:
-            if 'next' not in result.get('links', {}):
-                return
+        yield from result[model_name]
 
+        # single page responses (no next link) finish here without any further requests
+        while 'next' in result.get('links', {}):
             result = self._get(result['links']['next'])
-            for model in result[model_name]:
-                yield model
+            yield from result[model_name]
 
     return iter_method
 
@@ -109,6 +108,11 @@ class BaseAPIClient(object):
         self._user = user
         self._enabled = enabled
         self._timeout = timeout
+        # sessions are kept for the lifetime of the client so that consecutive requests (e.g. walking the pages of
+        # an iter method) can reuse pooled keep-alive connections rather than opening a new one each time. clients
+        # are usually shared module-level objects and requests.Session isn't thread safe, so each thread gets its own.
+        # they're also created before pre-fork servers fork their workers, so sessions are tied to the process too.
+        self._local = threading.local()
 
     def _getuser(self, user=None):
         if user is None and self._user is None:
@@ -288,7 +292,23 @@ class BaseAPIClient(object):
         return r.url
 
     def _requests_retry_session(self, *, retry_read_timeouts: bool = True):
+        sessions = getattr(self._local, "sessions", None)
+        # a forked child inherits the parent's sessions along with their pooled sockets, which must never be shared
+        if sessions is None or self._local.pid != os.getpid():
+            sessions = self._local.sessions = {}
+            self._local.pid = os.getpid()
+        session = sessions.get(retry_read_timeouts)
+        if session is None:
+            session = sessions[retry_read_timeouts] = self._create_retry_session(
+                retry_read_timeouts=retry_read_timeouts,
+            )
+        return session
+
+    def _create_retry_session(self, *, retry_read_timeouts: bool = True):
         session = requests.Session()
+        # the session outlives the request, so never keep cookies set by the API (e.g. load balancer stickiness)
+        # or they'd be sent along with unrelated requests made later on by the same client
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
         # TODO: remove ignore once requests' typeshed entry is correct (currently missing status and raise_on_status).
         retry = Retry(  # type: ignore
             total=self._RETRIES,
@@ -1344,10 +1344,10 @@ class DataAPIClient(BaseAPIClient):
             }
         )
 
-    def find_direct_award_project_services(self, project_id, user_id=None, fields=[]):
+    def find_direct_award_project_services(self, project_id, user_id=None, fields=None):
         params = {"user-id": user_id}
         if fields:
-            params.update({"fields": ','.join(fields)})
+            params["fields"] = ','.join(fields)
 
         return self._get(
             "/direct-award/projects/{}/services".format(project_id),
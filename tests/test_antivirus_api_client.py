@@ -1,5 +1,5 @@
 import pytest
-import mock
+from types import SimpleNamespace
 
 from dmapiclient import AntivirusAPIClient
 
@@ -11,11 +11,10 @@ def antivirus_client():
 
 class TestAntivirusApiClient(object):
     def test_init_app_sets_attributes(self, antivirus_client):
-        app = mock.Mock()
-        app.config = {
+        app = SimpleNamespace(config={
             "DM_ANTIVIRUS_API_URL": "http://example",
             "DM_ANTIVIRUS_API_AUTH_TOKEN": "example-token",
-        }
+        })
         antivirus_client.init_app(app)
 
         assert antivirus_client.base_url == "http://example"
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 from contextlib import contextmanager
 from itertools import chain
+import http.server
 import logging
+import os
+import threading
 
 from flask import request
 import requests
 import requests_mock
 import pytest
-import mock
+from unittest import mock
 import io
 
 from dmtestutils.comparisons import RestrictedAny
@@ -241,6 +244,82 @@ class TestBaseApiClient(object):
         base_client._request('GET', 'https://host/path/')
         assert rmock.called
 
+    def test_session_is_reused_between_requests(self, base_client, rmock):
+        rmock.request(
+            "GET",
+            "http://baseurl/",
+            json={},
+            status_code=200)
+
+        with mock.patch.object(requests.Session, "request", autospec=True, side_effect=requests.Session.request) as req:
+            base_client._request('GET', '/')
+            base_client._request('GET', '/')
+            base_client._request('GET', '/', client_wait_for_response=False)
+
+        sessions = [call[0][0] for call in req.call_args_list]
+        assert len(sessions) == 3
+        assert sessions[0] is sessions[1]
+        # no-wait requests don't retry read timeouts so need a differently configured session
+        assert sessions[2] is not sessions[0]
+
+    def test_session_is_not_shared_between_threads(self, base_client):
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(base_client._requests_retry_session()))
+        thread.start()
+        thread.join()
+
+        assert sessions[0] is not base_client._requests_retry_session()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+    def test_session_is_not_shared_with_forked_child(self, base_client):
+        parent_session = base_client._requests_retry_session()
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # in the child: report back and exit without running any pytest teardown
+            os.close(read_fd)
+            os.write(write_fd, b"1" if base_client._requests_retry_session() is not parent_session else b"0")
+            os._exit(0)
+
+        os.close(write_fd)
+        child_got_new_session = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert child_got_new_session == b"1"
+        assert base_client._requests_retry_session() is parent_session
+
+    def test_response_cookies_are_not_sent_with_later_requests(self):
+        # requests_mock responses never reach the session's cookie jar, so this needs a real server
+        received_cookies = []
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                received_cookies.append(self.headers.get("Cookie"))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Set-Cookie", "AWSALB=abc; Path=/")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            client = BaseAPIClient(f"http://127.0.0.1:{server.server_port}", "auth-token", True)
+            client._request("GET", "/")
+            client._request("GET", "/")
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        assert received_cookies == [None, None]
+
     def test_null_api_throws(self):
         bad_client = BaseAPIClient(None, 'auth-token', True)
         with pytest.raises(ImproperlyConfigured):
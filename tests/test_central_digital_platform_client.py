@@ -1,6 +1,5 @@
 import pytest
-import mock
-from io import BytesIO
+from types import SimpleNamespace
 from werkzeug.exceptions import NotFound
 
 
@@ -30,11 +29,10 @@ class TestCentralDigitalPlatformApiClient(object):
         assert rmock.last_request.headers.get("User-Agent").startswith("DM-API-Client/")
 
     def test_init_app_sets_attributes(self, cdp_client):
-        app = mock.Mock()
-        app.config = {
+        app = SimpleNamespace(config={
             "DM_CENTRAL_DIGITAL_PLATFORM_API_URL": "http://example",
             "DM_CENTRAL_DIGITAL_PLATFORM_API_KEY": "example-api-key",
-        }
+        })
         cdp_client.init_app(app)
 
         assert cdp_client.base_url == "http://example"
@@ -59,19 +57,19 @@ class TestSupplierInformationMethods(object):
         assert rmock.called
 
     def test_get_supplier_submitted_information_raises_on_404(self, cdp_client, rmock):
-        with pytest.raises(HTTPError):
-            rmock.get(
-                'http://cdp-baseurl/share/data/123',
-                json={'supplierInformation': 'result'},
-                status_code=404
-            )
+        rmock.get(
+            'http://cdp-baseurl/share/data/123',
+            json={'supplierInformation': 'result'},
+            status_code=404
+        )
 
+        with pytest.raises(HTTPError):
             cdp_client.get_supplier_submitted_information(123)
 
     def test_get_document_within_supplier_submitted_information(self, cdp_client, rmock):
         rmock.get(
             "http://documents-server/123456",
-            body=BytesIO(valid_pdf_bytes),
+            content=valid_pdf_bytes,
             status_code=200
         )
         rmock.get(
@@ -93,7 +91,7 @@ class TestSupplierInformationMethods(object):
     def test_get_supplier_submitted_information_as_file(self, cdp_client, rmock):
         rmock.get(
             "http://cdp-baseurl/share/data/123/file",
-            body=BytesIO(valid_pdf_bytes),
+            content=valid_pdf_bytes,
             status_code=200
         )
 
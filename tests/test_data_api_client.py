@@ -1,25 +1,31 @@
 # -*- coding: utf-8 -*-
 from flask import json
 import pytest
-import mock
+from types import SimpleNamespace
 
 from dmapiclient import DataAPIClient
 from dmapiclient import APIError, HTTPError
 from dmapiclient.audit import AuditTypes
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def data_client():
     return DataAPIClient('http://baseurl', 'auth-token', True)
 
 
+@pytest.fixture
+def data_client_with_user():
+    return DataAPIClient('http://baseurl', 'auth-token', user="testuser@example.com", enabled=True)
+
+
 class TestDataApiClient(object):
-    def test_init_app_sets_attributes(self, data_client):
-        app = mock.Mock()
-        app.config = {
+    def test_init_app_sets_attributes(self):
+        # init_app mutates the client so use one that isn't shared with other tests
+        data_client = DataAPIClient('http://baseurl', 'auth-token', True)
+        app = SimpleNamespace(config={
             "DM_DATA_API_URL": "http://example",
             "DM_DATA_API_AUTH_TOKEN": "example-token",
-        }
+        })
         data_client.init_app(app)
 
         assert data_client.base_url == "http://example"
@@ -36,15 +42,13 @@ class TestDataApiClient(object):
         assert result['status'] == "ok"
         assert rmock.called
 
-    def test_updated_by_user_can_be_set_in_constructor(self, rmock):
-        data_client = DataAPIClient('http://baseurl', 'auth-token', user="testuser@example.com", enabled=True)
-
+    def test_updated_by_user_can_be_set_in_constructor(self, data_client_with_user, rmock):
         rmock.patch(
             "http://baseurl/suppliers/123/frameworks/g-cloud-7/declaration",
             json={"declaration": {"question": "answer"}},
             status_code=200)
 
-        data_client.update_supplier_declaration(123, 'g-cloud-7', {"question": "answer"})
+        data_client_with_user.update_supplier_declaration(123, 'g-cloud-7', {"question": "answer"})
 
         assert rmock.request_history[0].json() == {
             'updated_by': 'testuser@example.com',
@@ -94,12 +98,12 @@ class TestServiceMethods(object):
         assert result is None
 
     def test_get_service_raises_on_non_404(self, data_client, rmock):
-        with pytest.raises(APIError):
-            rmock.get(
-                'http://baseurl/services/123',
-                json={'services': 'result'},
-                status_code=400)
+        rmock.get(
+            'http://baseurl/services/123',
+            json={'services': 'result'},
+            status_code=400)
 
+        with pytest.raises(APIError):
             data_client.get_service(123)
 
     def test_find_services(self, data_client, rmock):
@@ -422,12 +426,12 @@ class TestUserMethods(object):
         assert user == user_with_no_supplier
 
     def test_authenticate_user_raises_on_500(self, data_client, rmock):
-        with pytest.raises(APIError):
-            rmock.post(
-                'http://baseurl/users/auth',
-                text=json.dumps({'authorization': False}),
-                status_code=500)
+        rmock.post(
+            'http://baseurl/users/auth',
+            text=json.dumps({'authorization': False}),
+            status_code=500)
 
+        with pytest.raises(APIError):
             data_client.authenticate_user("email_address", "password")
 
     def test_create_user(self, data_client, rmock):
@@ -467,13 +471,12 @@ class TestUserMethods(object):
             "updated_by": "test@example.com"
         }
 
-    def test_update_user_password_with_user_property(self, rmock):
-        data_client = DataAPIClient('http://baseurl', 'auth-token', user="testuser@example.com", enabled=True)
+    def test_update_user_password_with_user_property(self, data_client_with_user, rmock):
         rmock.post(
             "http://baseurl/users/123",
             json={},
             status_code=200)
-        assert data_client.update_user_password(123, "newpassword")
+        assert data_client_with_user.update_user_password(123, "newpassword")
         assert rmock.last_request.json() == {
             "users": {
                 "password": "newpassword"
@@ -827,10 +830,10 @@ class TestSupplierMethods(object):
             "http://baseurl/suppliers/123",
             status_code=404)
 
-        try:
+        with pytest.raises(HTTPError):
             data_client.get_supplier(123)
-        except HTTPError:
-            assert rmock.called
+
+        assert rmock.called
 
     def test_get_supplier_with_cdp_supplier_information(self, data_client, rmock):
         rmock.get(
@@ -2132,12 +2135,12 @@ class TestFrameworkMethods(object):
         assert rmock.called
 
     def test_get_framework_stats_raises_on_error(self, data_client, rmock):
-        with pytest.raises(APIError):
-            rmock.get(
-                'http://baseurl/frameworks/g-cloud-11/stats',
-                json={'drafts': 1},
-                status_code=400)
+        rmock.get(
+            'http://baseurl/frameworks/g-cloud-11/stats',
+            json={'drafts': 1},
+            status_code=400)
 
+        with pytest.raises(APIError):
             data_client.get_framework_stats('g-cloud-11')
 
     def test_find_frameworks(self, data_client, rmock):
@@ -3011,6 +3014,73 @@ class TestOutcomeMethods(object):
         assert result == {"outcomes": []}
 
 
+FIND_ITER_CASES = (
+    ('find_users_iter', 'users', 'users', {}),
+    ('find_briefs_iter', 'briefs', 'briefs', {}),
+    ('find_brief_responses_iter', 'briefResponses', 'brief-responses', {}),
+    ('find_audit_events_iter', 'auditEvents', 'audit-events', {}),
+    ('find_suppliers_iter', 'suppliers', 'suppliers', {}),
+    ('find_services_iter', 'services', 'services', {}),
+    ('find_direct_award_projects_iter', 'projects', 'direct-award/projects', {}),
+    ('find_direct_award_project_searches_iter', 'searches', 'direct-award/projects/1/searches', {'project_id': 1}),
+    pytest.param(
+        'find_direct_award_project_searches_iter',
+        'searches',
+        'direct-award/projects/1/searches?user-id=123',
+        {'project_id': 1, 'user_id': 123},
+        id='find_direct_award_project_searches_iter_with_user_id',
+    ),
+    ('find_direct_award_project_services_iter', 'services', 'direct-award/projects/1/services', {'project_id': 1}),
+    ('export_users_iter', 'users', 'users/export/g-cloud-9', {'framework_slug': 'g-cloud-9'}),
+    ('export_suppliers_iter', 'suppliers', 'suppliers/export/g-cloud-9', {'framework_slug': 'g-cloud-9'}),
+    ('find_outcomes_iter', 'outcomes', 'outcomes', {}),
+    ('get_buyer_email_domains_iter', 'buyerEmailDomains', 'buyer-email-domains', {}),
+    ('find_communications_iter', 'communications', 'communications', {}),
+    (
+        'find_lot_questions_responses_iter',
+        'lotQuestionsResponses',
+        'lot-questions-responses?framework=g-cloud-6&supplier_id=1234',
+        {'supplier_id': 1234, 'framework_slug': 'g-cloud-6'},
+    ),
+    (
+        'find_lot_questions_responses_applicants_for_framework_lot_iter',
+        'lotQuestionsResponses',
+        'lot-questions-responses/applications?framework=g-cloud-6&lot=g-lot',
+        {'framework_slug': 'g-cloud-6', 'lot_slug': 'g-lot'},
+    ),
+    (
+        'find_evaluator_framework_lots_iter',
+        'evaluatorFrameworkLots',
+        'evaluations/evaluator-framework-lots?framework=g-cloud-6&lot=g-things&assigned=True',
+        {'framework': 'g-cloud-6', 'lot': 'g-things'},
+    ),
+    (
+        'find_evaluator_framework_lot_sections_iter',
+        'evaluatorFrameworkLotSections',
+        'evaluations/evaluator-framework-lot-sections?framework=g-cloud-6&lot=g-things&assigned=True',
+        {'framework': 'g-cloud-6', 'lot': 'g-things'},
+    ),
+    (
+        'find_evaluator_framework_lot_section_evaluations_iter',
+        'evaluatorFrameworkLotSectionEvaluations',
+        'evaluations/evaluator-framework-lot-section-evaluations?framework=g-cloud-6&lot=g-things',
+        {'framework': 'g-cloud-6', 'lot': 'g-things'},
+    ),
+    (
+        'find_supplier_framework_applications_by_lot_iter',
+        'supplierFrameworks',
+        'frameworks/g-cloud-6/suppliers/applications?lot=g-things',
+        {'framework_slug': 'g-cloud-6', 'lot_slug': 'g-things'},
+    ),
+    (
+        'find_lot_questions_response_section_evaluations_iter',
+        'lotQuestionsResponseSectionEvaluations',
+        'lot-questions-response-section-evaluations?framework=g-cloud-6&lot=g-things',
+        {'framework': 'g-cloud-6', 'lot': 'g-things'},
+    ),
+)
+
+
 class TestDataAPIClientIterMethods(object):
     def _test_find_iter(self, data_client, rmock, method_name, model_name, url_path, iter_kwargs={}):
         rmock.get(
@@ -3051,40 +3121,14 @@ class TestDataAPIClientIterMethods(object):
         assert results[0]['id'] == 1
         assert results[1]['id'] == 2
 
-    def test_find_users_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_users_iter',
-            model_name='users',
-            url_path='users')
-
-    def test_find_briefs_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_briefs_iter',
-            model_name='briefs',
-            url_path='briefs')
-
-    def test_find_brief_responses_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_brief_responses_iter',
-            model_name='briefResponses',
-            url_path='brief-responses')
-
-    def test_find_audit_events_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_audit_events_iter',
-            model_name='auditEvents',
-            url_path='audit-events')
-
-    def test_find_suppliers_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_suppliers_iter',
-            model_name='suppliers',
-            url_path='suppliers')
+    @pytest.mark.parametrize(
+        "method_name, model_name, url_path, iter_kwargs",
+        FIND_ITER_CASES,
+        # cases wrapped in pytest.param carry their own id, which takes precedence over the one listed here
+        ids=[method_name for method_name, *_ in FIND_ITER_CASES],
+    )
+    def test_find_iter(self, data_client, rmock, method_name, model_name, url_path, iter_kwargs):
+        self._test_find_iter(data_client, rmock, method_name, model_name, url_path, iter_kwargs)
 
     def test_find_framework_suppliers_iter(self, data_client, rmock):
         rmock.get(
@@ -3159,13 +3203,6 @@ class TestDataAPIClientIterMethods(object):
         assert results[1]['foo'] == 'bat'
         assert results[2]['foo'] == 'baz'
 
-    def test_find_services_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_services_iter',
-            model_name='services',
-            url_path='services')
-
     def test_find_services_iter_additional_arguments(self, data_client, rmock):
         rmock.get(
             'http://baseurl/services?supplier_id=123',
@@ -3176,30 +3213,8 @@ class TestDataAPIClientIterMethods(object):
             status_code=200)
 
         result = data_client.find_services_iter(123)
-        results = list(result)
-
-        assert len(results) == 2
-
-    def test_find_direct_award_projects_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_direct_award_projects_iter',
-            model_name='projects',
-            url_path='direct-award/projects')
-
-    @pytest.mark.parametrize('url_path, iter_kwargs',
-                             (
-                                 ('direct-award/projects/1/searches', {'project_id': 1}),
-                                 ('direct-award/projects/1/searches?user-id=123', {'project_id': 1, 'user_id': 123}),
-                             ))
-    def test_find_direct_award_project_searches_iter(self, data_client, rmock, url_path, iter_kwargs):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_direct_award_project_searches_iter',
-            model_name='searches',
-            url_path=url_path,
-            iter_kwargs=iter_kwargs
-        )
+        assert sum(1 for _ in result) == 2
+        assert rmock.call_count == 1
 
     def test_get_direct_award_project_services(self, data_client, rmock):
         rmock.get('/direct-award/projects/1/services',
@@ -3217,60 +3232,6 @@ class TestDataAPIClientIterMethods(object):
         result = data_client.find_direct_award_project_services(user_id=123, project_id=1, fields=['id', 'price'])
         assert result == {"services": "ok"}
 
-    def test_find_direct_award_project_services_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_direct_award_project_services_iter',
-            model_name='services',
-            url_path='direct-award/projects/1/services',
-            iter_kwargs={'project_id': 1}
-        )
-
-    def test_export_users_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='export_users_iter',
-            model_name='users',
-            url_path='users/export/g-cloud-9',
-            iter_kwargs={'framework_slug': 'g-cloud-9'}
-        )
-
-    def test_export_suppliers_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='export_suppliers_iter',
-            model_name='suppliers',
-            url_path='suppliers/export/g-cloud-9',
-            iter_kwargs={'framework_slug': 'g-cloud-9'}
-        )
-
-    def test_find_outcomes_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_outcomes_iter',
-            model_name='outcomes',
-            url_path='outcomes',
-            iter_kwargs={},
-        )
-
-    def test_get_buyer_email_domains_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name="get_buyer_email_domains_iter",
-            model_name="buyerEmailDomains",
-            url_path="buyer-email-domains",
-            iter_kwargs={},
-        )
-
-    def test_find_communications_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_communications_iter',
-            model_name='communications',
-            url_path='communications',
-            iter_kwargs={}
-        )
-
     def test_find_communications_iter_additional_arguments(self, data_client, rmock):
         rmock.get(
             'http://baseurl/communications?framework=g-cloud-6&supplier_id=123',
@@ -3281,50 +3242,12 @@ class TestDataAPIClientIterMethods(object):
             status_code=200)
 
         result = data_client.find_communications_iter(framework='g-cloud-6', supplier_id=123)
-        results = list(result)
-
-        assert len(results) == 2
-
-    def test_find_lot_questions_responses_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_lot_questions_responses_iter',
-            model_name='lotQuestionsResponses',
-            url_path='lot-questions-responses?framework=g-cloud-6&supplier_id=1234',
-            iter_kwargs={
-                'supplier_id': 1234,
-                'framework_slug': 'g-cloud-6'
-            }
-        )
-
-    def test_find_lot_questions_responses_applicants_for_framework_lot_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_lot_questions_responses_applicants_for_framework_lot_iter',
-            model_name='lotQuestionsResponses',
-            url_path='lot-questions-responses/applications?framework=g-cloud-6&lot=g-lot',
-            iter_kwargs={
-                'framework_slug': 'g-cloud-6',
-                'lot_slug': 'g-lot'
-            }
-        )
-
-    def test_find_evaluator_framework_lots_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_evaluator_framework_lots_iter',
-            model_name='evaluatorFrameworkLots',
-            url_path='evaluations/evaluator-framework-lots?framework=g-cloud-6&lot=g-things&assigned=True',
-            iter_kwargs={
-                'framework': 'g-cloud-6',
-                'lot': 'g-things'
-            }
-        )
+        assert sum(1 for _ in result) == 2
 
     def test_find_evaluator_framework_lots_iter_additional_arguments(self, data_client, rmock):
         rmock.get(
-            'http://baseurl/evaluations/evaluator-framework-lots?'
-            'framework=g-cloud-6&lot=g-things&assigned=True&user_id=123',
+            'http://baseurl/evaluations/evaluator-framework-lots',
+            complete_qs=False,
             json={
                 'links': {},
                 'evaluatorFrameworkLots': [{'id': 1}, {'id': 2}]
@@ -3332,26 +3255,18 @@ class TestDataAPIClientIterMethods(object):
             status_code=200)
 
         result = data_client.find_evaluator_framework_lots_iter('g-cloud-6', 'g-things', user_id=123)
-        results = list(result)
-
-        assert len(results) == 2
-
-    def test_find_evaluator_framework_lot_sections_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_evaluator_framework_lot_sections_iter',
-            model_name='evaluatorFrameworkLotSections',
-            url_path='evaluations/evaluator-framework-lot-sections?framework=g-cloud-6&lot=g-things&assigned=True',
-            iter_kwargs={
-                'framework': 'g-cloud-6',
-                'lot': 'g-things'
-            }
-        )
+        assert sum(1 for _ in result) == 2
+        assert rmock.last_request.qs == {
+            'framework': ['g-cloud-6'],
+            'lot': ['g-things'],
+            'assigned': ['true'],
+            'user_id': ['123'],
+        }
 
     def test_find_evaluator_framework_lot_sections_iter_additional_arguments(self, data_client, rmock):
         rmock.get(
-            'http://baseurl/evaluations/evaluator-framework-lot-sections?'
-            'framework=g-cloud-6&lot=g-things&assigned=True&section_slug=the-slug',
+            'http://baseurl/evaluations/evaluator-framework-lot-sections',
+            complete_qs=False,
             json={
                 'links': {},
                 'evaluatorFrameworkLotSections': [{'id': 1}, {'id': 2}]
@@ -3363,21 +3278,13 @@ class TestDataAPIClientIterMethods(object):
             'g-things',
             section_slug='the-slug'
         )
-        results = list(result)
-
-        assert len(results) == 2
-
-    def test_find_evaluator_framework_lot_section_evaluations_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_evaluator_framework_lot_section_evaluations_iter',
-            model_name='evaluatorFrameworkLotSectionEvaluations',
-            url_path='evaluations/evaluator-framework-lot-section-evaluations?framework=g-cloud-6&lot=g-things',
-            iter_kwargs={
-                'framework': 'g-cloud-6',
-                'lot': 'g-things'
-            }
-        )
+        assert sum(1 for _ in result) == 2
+        assert rmock.last_request.qs == {
+            'framework': ['g-cloud-6'],
+            'lot': ['g-things'],
+            'assigned': ['true'],
+            'section_slug': ['the-slug'],
+        }
 
     def test_find_evaluator_framework_lot_section_evaluations_iter_additional_arguments(self, data_client, rmock):
         rmock.get(
@@ -3394,33 +3301,7 @@ class TestDataAPIClientIterMethods(object):
             'g-things',
             section_slug='the-slug'
         )
-        results = list(result)
-
-        assert len(results) == 2
-
-    def test_find_supplier_framework_applications_by_lot_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_supplier_framework_applications_by_lot_iter',
-            model_name='supplierFrameworks',
-            url_path='frameworks/g-cloud-6/suppliers/applications?lot=g-things',
-            iter_kwargs={
-                'framework_slug': 'g-cloud-6',
-                'lot_slug': 'g-things',
-            }
-        )
-
-    def test_find_lot_questions_response_section_evaluations_iter(self, data_client, rmock):
-        self._test_find_iter(
-            data_client, rmock,
-            method_name='find_lot_questions_response_section_evaluations_iter',
-            model_name='lotQuestionsResponseSectionEvaluations',
-            url_path='lot-questions-response-section-evaluations?framework=g-cloud-6&lot=g-things',
-            iter_kwargs={
-                'framework': 'g-cloud-6',
-                'lot': 'g-things'
-            }
-        )
+        assert sum(1 for _ in result) == 2
 
     def test_find_lot_questions_response_section_evaluations_iter_additional_arguments(self, data_client, rmock):
         rmock.get(
@@ -3437,9 +3318,76 @@ class TestDataAPIClientIterMethods(object):
             'g-things',
             section_slug='the-slug'
         )
-        results = list(result)
+        assert sum(1 for _ in result) == 2
+
+
+COMMUNICATION_ATTACHMENTS = [
+    {
+        "id": 1,
+        "communicationMessageId": 1,
+        "filePath": "Attachment_1.pdf",
+    },
+    {
+        "id": 2,
+        "communicationMessageId": 1,
+        "filePath": "Attachment_2.pdf",
+    },
+]
+
+COMMUNICATION_MESSAGE = {
+    'id': 1,
+    'communicationId': 123,
+    'text': 'Message text',
+    'sentAt': '2024-03-14T00:00:00.000000Z',
+    'sentByUserId': 123,
+    'sentByUserEmail': 'test+123@digital.gov.uk',
+    'target': 'for_admin',
+    'attachments': []
+}
+
+COMMUNICATION_MESSAGE_WITH_ATTACHMENT = {**COMMUNICATION_MESSAGE, 'attachments': COMMUNICATION_ATTACHMENTS}
+
+COMMUNICATION = {
+    'id': 123,
+    'subject': 'Subject text',
+    'category': 'Compliance',
+    'supplierId': 0,
+    'supplierName': "Supplier 0",
+    'frameworkSlug': 'g-cloud-6',
+    'frameworkFramework': 'g-cloud',
+    'frameworkFamily': 'g-cloud',
+    'frameworkName': 'G-Cloud 6',
+    'frameworkStatus': 'pending',
+    'createdAt': '2024-03-14T00:00:00.000000Z',
+    'updatedAt': '2024-03-14T00:00:00.000000Z',
+    'messages': [
+        {
+            'id': 1,
+            'communicationId': 123,
+            'text': 'Message text',
+            'sentAt': '2024-03-14T00:00:00.000000Z',
+            'sentByUserId': 456,
+            'sentByUserEmail': 'test+456@digital.cabinet-office.gov.uk',
+            'target': 'for_supplier',
+            'attachments': []
+        }
+    ]
+}
 
-        assert len(results) == 2
+COMMUNICATION_WITH_ATTACHMENT = {
+    **COMMUNICATION,
+    'messages': [
+        {**COMMUNICATION['messages'][0], 'target': 'for_admin', 'attachments': COMMUNICATION_ATTACHMENTS},
+    ],
+}
+
+# the larger response bodies are serialized once here rather than by requests_mock on every request
+COMMUNICATION_MESSAGE_RESPONSE_BODY = json.dumps({"communicationMessages": COMMUNICATION_MESSAGE}).encode()
+COMMUNICATION_MESSAGE_WITH_ATTACHMENT_RESPONSE_BODY = json.dumps(
+    {"communicationMessages": COMMUNICATION_MESSAGE_WITH_ATTACHMENT}
+).encode()
+COMMUNICATION_RESPONSE_BODY = json.dumps({"communications": COMMUNICATION}).encode()
+COMMUNICATION_WITH_ATTACHMENT_RESPONSE_BODY = json.dumps({"communications": COMMUNICATION_WITH_ATTACHMENT}).encode()
 
 
 class TestCommunicationsMethods(object):
@@ -3452,7 +3400,6 @@ class TestCommunicationsMethods(object):
         result = data_client.find_communications()
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_find_communications_adds_page_parameter(self, data_client, rmock):
         rmock.get(
@@ -3463,7 +3410,6 @@ class TestCommunicationsMethods(object):
         result = data_client.find_communications(page=2)
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_find_communications_adds_framework_parameter(
             self, data_client, rmock):
@@ -3475,7 +3421,6 @@ class TestCommunicationsMethods(object):
         result = data_client.find_communications(framework='g-cloud-6')
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_find_communications_adds_supplier_id_parameter(
             self, data_client, rmock):
@@ -3487,7 +3432,6 @@ class TestCommunicationsMethods(object):
         result = data_client.find_communications(supplier_id=1)
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_find_communications_adds_resolved_parameter(
             self, data_client, rmock):
@@ -3499,7 +3443,6 @@ class TestCommunicationsMethods(object):
         result = data_client.find_communications(resolved=True)
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_find_communications_adds_resolution_parameter(
             self, data_client, rmock):
@@ -3511,7 +3454,6 @@ class TestCommunicationsMethods(object):
         result = data_client.find_communications(resolution="archived")
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_find_communications_adds_supplier_id_and_resolved_parameter(
             self, data_client, rmock):
@@ -3523,7 +3465,6 @@ class TestCommunicationsMethods(object):
         result = data_client.find_communications(supplier_id=1, resolved=True)
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_find_communications_adds_category_parameter(
             self, data_client, rmock):
@@ -3535,7 +3476,6 @@ class TestCommunicationsMethods(object):
         result = data_client.find_communications(category="Compliance")
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_find_communications_adds_subject_parameter(self, data_client, rmock):
         rmock.get(
@@ -3546,7 +3486,6 @@ class TestCommunicationsMethods(object):
         result = data_client.find_communications(subject='Default Subject')
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_find_communications_adds_supplier_name_parameter(self, data_client, rmock):
         rmock.get(
@@ -3557,7 +3496,6 @@ class TestCommunicationsMethods(object):
         result = data_client.find_communications(supplier_name="Supplier 1")
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_find_communications_adds_message_text_parameter(self, data_client, rmock):
         rmock.get(
@@ -3568,7 +3506,6 @@ class TestCommunicationsMethods(object):
         result = data_client.find_communications(message_text="This is")
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_find_communications_adds_sort_by_parameter(self, data_client, rmock):
         rmock.get(
@@ -3579,7 +3516,6 @@ class TestCommunicationsMethods(object):
         result = data_client.find_communications(sort_by="supplier_name:asc")
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_get_communication(self, data_client, rmock):
         rmock.get(
@@ -3590,17 +3526,16 @@ class TestCommunicationsMethods(object):
         result = data_client.get_communication(123)
 
         assert result == {"communications": "result"}
-        assert rmock.called
 
     def test_get_communication_should_return_404(self, data_client, rmock):
         rmock.get(
             "http://baseurl/communications/123",
             status_code=404)
 
-        try:
+        with pytest.raises(HTTPError):
             data_client.get_communication(123)
-        except HTTPError:
-            assert rmock.called
+
+        assert rmock.called
 
     def test_update_communication(self, data_client, rmock):
         rmock.post(
@@ -3612,7 +3547,6 @@ class TestCommunicationsMethods(object):
         result = data_client.update_communication(123, {"foo": "bar"}, 'admin')
 
         assert result == {"communications": "result"}
-        assert rmock.called
         assert rmock.request_history[0].json() == {
             'communications': {'foo': 'bar'}, 'updated_by': 'admin'
         }
@@ -3632,7 +3566,6 @@ class TestCommunicationsMethods(object):
         )
 
         assert result == {"message": "done"}
-        assert rmock.called
         assert rmock.last_request.json() == {
             "updated_by": "test@example.com",
             "resolvedByUserId": 456,
@@ -3653,7 +3586,6 @@ class TestCommunicationsMethods(object):
         )
 
         assert result == {"message": "done"}
-        assert rmock.called
         assert rmock.last_request.json() == {
             "updated_by": "test@example.com",
             "readByUserId": 456
@@ -3662,16 +3594,8 @@ class TestCommunicationsMethods(object):
     def test_create_communication_message(self, data_client, rmock):
         rmock.post(
             "http://baseurl/communications/123/messages",
-            json={"communicationMessages": {
-                'id': 1,
-                'communicationId': 123,
-                'text': 'Message text',
-                'sentAt': '2024-03-14T00:00:00.000000Z',
-                'sentByUserId': 123,
-                'sentByUserEmail': 'test+123@digital.gov.uk',
-                'target': 'for_admin',
-                'attachments': []
-            }},
+            content=COMMUNICATION_MESSAGE_RESPONSE_BODY,
+            headers={"Content-Type": "application/json"},
             status_code=201,
         )
 
@@ -3685,19 +3609,7 @@ class TestCommunicationsMethods(object):
             user="test@example.com"
         )
 
-        assert result == {
-            "communicationMessages": {
-                'id': 1,
-                'communicationId': 123,
-                'text': 'Message text',
-                'sentAt': '2024-03-14T00:00:00.000000Z',
-                'sentByUserId': 123,
-                'sentByUserEmail': 'test+123@digital.gov.uk',
-                'target': 'for_admin',
-                'attachments': []
-            }
-        }
-        assert rmock.called
+        assert result == {"communicationMessages": COMMUNICATION_MESSAGE}
         assert rmock.last_request.json() == {
             "updated_by": "test@example.com",
             "communicationMessages": {
@@ -3710,27 +3622,8 @@ class TestCommunicationsMethods(object):
     def test_create_communication_message_with_attachment(self, data_client, rmock):
         rmock.post(
             "http://baseurl/communications/123/messages",
-            json={"communicationMessages": {
-                'id': 1,
-                'communicationId': 123,
-                'text': 'Message text',
-                'sentAt': '2024-03-14T00:00:00.000000Z',
-                'sentByUserId': 123,
-                'sentByUserEmail': 'test+123@digital.gov.uk',
-                'target': 'for_admin',
-                'attachments': [
-                    {
-                        "id": 1,
-                        "communicationMessageId": 1,
-                        "filePath": "Attachment_1.pdf",
-                    },
-                    {
-                        "id": 2,
-                        "communicationMessageId": 1,
-                        "filePath": "Attachment_2.pdf",
-                    },
-                ]
-            }},
+            content=COMMUNICATION_MESSAGE_WITH_ATTACHMENT_RESPONSE_BODY,
+            headers={"Content-Type": "application/json"},
             status_code=201,
         )
 
@@ -3752,30 +3645,7 @@ class TestCommunicationsMethods(object):
             user="test@example.com"
         )
 
-        assert result == {
-            "communicationMessages": {
-                'id': 1,
-                'communicationId': 123,
-                'text': 'Message text',
-                'sentAt': '2024-03-14T00:00:00.000000Z',
-                'sentByUserId': 123,
-                'sentByUserEmail': 'test+123@digital.gov.uk',
-                'target': 'for_admin',
-                'attachments': [
-                    {
-                        "id": 1,
-                        "communicationMessageId": 1,
-                        "filePath": "Attachment_1.pdf",
-                    },
-                    {
-                        "id": 2,
-                        "communicationMessageId": 1,
-                        "filePath": "Attachment_2.pdf",
-                    },
-                ]
-            }
-        }
-        assert rmock.called
+        assert result == {"communicationMessages": COMMUNICATION_MESSAGE_WITH_ATTACHMENT}
         assert rmock.last_request.json() == {
             "updated_by": "test@example.com",
             "communicationMessages": {
@@ -3796,32 +3666,8 @@ class TestCommunicationsMethods(object):
     def test_create_communication(self, data_client, rmock):
         rmock.post(
             "http://baseurl/communications",
-            json={"communications": {
-                'id': 123,
-                'subject': 'Subject text',
-                'category': 'Compliance',
-                'supplierId': 0,
-                'supplierName': "Supplier 0",
-                'frameworkSlug': 'g-cloud-6',
-                'frameworkFramework': 'g-cloud',
-                'frameworkFamily': 'g-cloud',
-                'frameworkName': 'G-Cloud 6',
-                'frameworkStatus': 'pending',
-                'createdAt': '2024-03-14T00:00:00.000000Z',
-                'updatedAt': '2024-03-14T00:00:00.000000Z',
-                'messages': [
-                    {
-                        'id': 1,
-                        'communicationId': 123,
-                        'text': 'Message text',
-                        'sentAt': '2024-03-14T00:00:00.000000Z',
-                        'sentByUserId': 456,
-                        'sentByUserEmail': 'test+456@digital.cabinet-office.gov.uk',
-                        'target': 'for_supplier',
-                        'attachments': []
-                    }
-                ]
-            }},
+            content=COMMUNICATION_RESPONSE_BODY,
+            headers={"Content-Type": "application/json"},
             status_code=201,
         )
 
@@ -3837,35 +3683,7 @@ class TestCommunicationsMethods(object):
             user="test@example.com"
         )
 
-        assert result == {
-            "communications": {
-                'id': 123,
-                'subject': 'Subject text',
-                'category': 'Compliance',
-                'supplierId': 0,
-                'supplierName': "Supplier 0",
-                'frameworkSlug': 'g-cloud-6',
-                'frameworkFramework': 'g-cloud',
-                'frameworkFamily': 'g-cloud',
-                'frameworkName': 'G-Cloud 6',
-                'frameworkStatus': 'pending',
-                'createdAt': '2024-03-14T00:00:00.000000Z',
-                'updatedAt': '2024-03-14T00:00:00.000000Z',
-                'messages': [
-                    {
-                        'id': 1,
-                        'communicationId': 123,
-                        'text': 'Message text',
-                        'sentAt': '2024-03-14T00:00:00.000000Z',
-                        'sentByUserId': 456,
-                        'sentByUserEmail': 'test+456@digital.cabinet-office.gov.uk',
-                        'target': 'for_supplier',
-                        'attachments': []
-                    }
-                ]
-            }
-        }
-        assert rmock.called
+        assert result == {"communications": COMMUNICATION}
         assert rmock.last_request.json() == {
             "updated_by": "test@example.com",
             "communications": {
@@ -3883,43 +3701,8 @@ class TestCommunicationsMethods(object):
     def test_create_communication_with_attachment(self, data_client, rmock):
         rmock.post(
             "http://baseurl/communications",
-            json={"communications": {
-                'id': 123,
-                'subject': 'Subject text',
-                'category': 'Compliance',
-                'supplierId': 0,
-                'supplierName': "Supplier 0",
-                'frameworkSlug': 'g-cloud-6',
-                'frameworkFramework': 'g-cloud',
-                'frameworkFamily': 'g-cloud',
-                'frameworkName': 'G-Cloud 6',
-                'frameworkStatus': 'pending',
-                'createdAt': '2024-03-14T00:00:00.000000Z',
-                'updatedAt': '2024-03-14T00:00:00.000000Z',
-                'messages': [
-                    {
-                        'id': 1,
-                        'communicationId': 123,
-                        'text': 'Message text',
-                        'sentAt': '2024-03-14T00:00:00.000000Z',
-                        'sentByUserId': 456,
-                        'sentByUserEmail': 'test+456@digital.cabinet-office.gov.uk',
-                        'target': 'for_admin',
-                        'attachments': [
-                            {
-                                "id": 1,
-                                "communicationMessageId": 1,
-                                "filePath": "Attachment_1.pdf",
-                            },
-                            {
-                                "id": 2,
-                                "communicationMessageId": 1,
-                                "filePath": "Attachment_2.pdf",
-                            },
-                        ]
-                    }
-                ]
-            }},
+            content=COMMUNICATION_WITH_ATTACHMENT_RESPONSE_BODY,
+            headers={"Content-Type": "application/json"},
             status_code=201,
         )
 
@@ -3943,46 +3726,7 @@ class TestCommunicationsMethods(object):
             user="test@example.com"
         )
 
-        assert result == {
-            "communications": {
-                'id': 123,
-                'subject': 'Subject text',
-                'category': 'Compliance',
-                'supplierId': 0,
-                'supplierName': "Supplier 0",
-                'frameworkSlug': 'g-cloud-6',
-                'frameworkFramework': 'g-cloud',
-                'frameworkFamily': 'g-cloud',
-                'frameworkName': 'G-Cloud 6',
-                'frameworkStatus': 'pending',
-                'createdAt': '2024-03-14T00:00:00.000000Z',
-                'updatedAt': '2024-03-14T00:00:00.000000Z',
-                'messages': [
-                    {
-                        'id': 1,
-                        'communicationId': 123,
-                        'text': 'Message text',
-                        'sentAt': '2024-03-14T00:00:00.000000Z',
-                        'sentByUserId': 456,
-                        'sentByUserEmail': 'test+456@digital.cabinet-office.gov.uk',
-                        'target': 'for_admin',
-                        'attachments': [
-                            {
-                                "id": 1,
-                                "communicationMessageId": 1,
-                                "filePath": "Attachment_1.pdf",
-                            },
-                            {
-                                "id": 2,
-                                "communicationMessageId": 1,
-                                "filePath": "Attachment_2.pdf",
-                            },
-                        ]
-                    }
-                ]
-            }
-        }
-        assert rmock.called
+        assert result == {"communications": COMMUNICATION_WITH_ATTACHMENT}
         assert rmock.last_request.json() == {
             "updated_by": "test@example.com",
             "communications": {
@@ -4006,6 +3750,16 @@ class TestCommunicationsMethods(object):
         }
 
 
+SYSTEM_MESSAGE = {
+    'id': 123,
+    'slug': 'test-system-message',
+    'data': {
+        "system-message-key": "system-message-value"
+    },
+    'show': False,
+}
+
+
 class TestSystemMessagesMethods(object):
     def test_get_system_message(self, data_client, rmock):
         rmock.get(
@@ -4016,29 +3770,21 @@ class TestSystemMessagesMethods(object):
         result = data_client.get_system_message("test-system-message")
 
         assert result == {"systemMessages": "result"}
-        assert rmock.called
 
     def test_get_system_message_should_return_404(self, data_client, rmock):
         rmock.get(
             "http://baseurl/system-messages/test-system-message",
             status_code=404)
 
-        try:
+        with pytest.raises(HTTPError):
             data_client.get_system_message("test-system-message")
-        except HTTPError:
-            assert rmock.called
+
+        assert rmock.called
 
     def test_create_system_message(self, data_client, rmock):
         rmock.post(
             "http://baseurl/system-messages",
-            json={"systemMessages": {
-                'id': 123,
-                'slug': 'test-system-message',
-                'data': {
-                    "system-message-key": "system-message-value"
-                },
-                'show': False,
-            }},
+            json={"systemMessages": SYSTEM_MESSAGE},
             status_code=201,
         )
 
@@ -4050,17 +3796,7 @@ class TestSystemMessagesMethods(object):
             user="test@example.com"
         )
 
-        assert result == {
-            "systemMessages": {
-                'id': 123,
-                'slug': 'test-system-message',
-                'data': {
-                    "system-message-key": "system-message-value"
-                },
-                'show': False,
-            }
-        }
-        assert rmock.called
+        assert result == {"systemMessages": SYSTEM_MESSAGE}
         assert rmock.last_request.json() == {
             "updated_by": "test@example.com",
             "systemMessages": {
@@ -4075,14 +3811,7 @@ class TestSystemMessagesMethods(object):
     def test_create_system_with_show(self, data_client, rmock, show):
         rmock.post(
             "http://baseurl/system-messages",
-            json={"systemMessages": {
-                'id': 123,
-                'slug': 'test-system-message',
-                'data': {
-                    "system-message-key": "system-message-value"
-                },
-                'show': show,
-            }},
+            json={"systemMessages": {**SYSTEM_MESSAGE, 'show': show}},
             status_code=201,
         )
 
@@ -4095,17 +3824,7 @@ class TestSystemMessagesMethods(object):
             user="test@example.com"
         )
 
-        assert result == {
-            "systemMessages": {
-                'id': 123,
-                'slug': 'test-system-message',
-                'data': {
-                    "system-message-key": "system-message-value"
-                },
-                'show': show,
-            }
-        }
-        assert rmock.called
+        assert result == {"systemMessages": {**SYSTEM_MESSAGE, 'show': show}}
         assert rmock.last_request.json() == {
             "updated_by": "test@example.com",
             "systemMessages": {
@@ -4120,14 +3839,7 @@ class TestSystemMessagesMethods(object):
     def test_update_system_message_with_data(self, data_client, rmock):
         rmock.post(
             "http://baseurl/system-messages/test-system-message",
-            json={"systemMessages": {
-                'id': 123,
-                'slug': 'test-system-message',
-                'data': {
-                    "system-message-key": "system-message-value"
-                },
-                'show': False,
-            }},
+            json={"systemMessages": SYSTEM_MESSAGE},
             status_code=200,
         )
 
@@ -4139,17 +3851,7 @@ class TestSystemMessagesMethods(object):
             user="test@example.com"
         )
 
-        assert result == {
-            "systemMessages": {
-                'id': 123,
-                'slug': 'test-system-message',
-                'data': {
-                    "system-message-key": "system-message-value"
-                },
-                'show': False,
-            }
-        }
-        assert rmock.called
+        assert result == {"systemMessages": SYSTEM_MESSAGE}
         assert rmock.last_request.json() == {
             "updated_by": "test@example.com",
             "systemMessages": {
@@ -4163,14 +3865,7 @@ class TestSystemMessagesMethods(object):
     def test_update_system_with_show(self, data_client, rmock, show):
         rmock.post(
             "http://baseurl/system-messages/test-system-message",
-            json={"systemMessages": {
-                'id': 123,
-                'slug': 'test-system-message',
-                'data': {
-                    "system-message-key": "system-message-value"
-                },
-                'show': show,
-            }},
+            json={"systemMessages": {**SYSTEM_MESSAGE, 'show': show}},
             status_code=200,
         )
 
@@ -4180,17 +3875,7 @@ class TestSystemMessagesMethods(object):
             user="test@example.com"
         )
 
-        assert result == {
-            "systemMessages": {
-                'id': 123,
-                'slug': 'test-system-message',
-                'data': {
-                    "system-message-key": "system-message-value"
-                },
-                'show': show,
-            }
-        }
-        assert rmock.called
+        assert result == {"systemMessages": {**SYSTEM_MESSAGE, 'show': show}}
         assert rmock.last_request.json() == {
             "updated_by": "test@example.com",
             "systemMessages": {
@@ -4201,14 +3886,7 @@ class TestSystemMessagesMethods(object):
     def test_update_system_message_with_show_and_data(self, data_client, rmock):
         rmock.post(
             "http://baseurl/system-messages/test-system-message",
-            json={"systemMessages": {
-                'id': 123,
-                'slug': 'test-system-message',
-                'data': {
-                    "system-message-key": "system-message-value"
-                },
-                'show': True,
-            }},
+            json={"systemMessages": {**SYSTEM_MESSAGE, 'show': True}},
             status_code=200,
         )
 
@@ -4221,17 +3899,7 @@ class TestSystemMessagesMethods(object):
             user="test@example.com"
         )
 
-        assert result == {
-            "systemMessages": {
-                'id': 123,
-                'slug': 'test-system-message',
-                'data': {
-                    "system-message-key": "system-message-value"
-                },
-                'show': True,
-            }
-        }
-        assert rmock.called
+        assert result == {"systemMessages": {**SYSTEM_MESSAGE, 'show': True}}
         assert rmock.last_request.json() == {
             "updated_by": "test@example.com",
             "systemMessages": {
@@ -4244,71 +3912,42 @@ class TestSystemMessagesMethods(object):
 
 
 class TestLotQuestionsResponsesMethods(object):
-    def test_find_lot_questions_responses(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/lot-questions-responses?framework=g-cloud-6&supplier_id=1234",
-            json={"lotQuestionsResponses": "result"},
-            status_code=200)
-
-        result = data_client.find_lot_questions_responses(1234, 'g-cloud-6')
-
-        assert result == {"lotQuestionsResponses": "result"}
-        assert rmock.called
-
-    def test_find_lot_questions_responses_adds_page_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/lot-questions-responses?framework=g-cloud-6&supplier_id=1234&page=2",
+    @pytest.mark.parametrize("kwargs, qs", (
+        ({}, ""),
+        ({"page": 2}, "&page=2"),
+    ), ids=[
+        "no_filters",
+        "page",
+    ])
+    def test_find_lot_questions_responses(self, data_client, rmock, kwargs, qs):
+        rmock.get(
+            f"http://baseurl/lot-questions-responses?framework=g-cloud-6&supplier_id=1234{qs}",
             json={"lotQuestionsResponses": "result"},
             status_code=200)
 
-        result = data_client.find_lot_questions_responses(1234, 'g-cloud-6', page=2)
-
-        assert result == {"lotQuestionsResponses": "result"}
-        assert rmock.called
-
-    def test_find_lot_questions_responses_applicants_for_framework_lot(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/lot-questions-responses/applications?framework=g-cloud-6&lot=g-lot",
-            json={"lotQuestionsResponses": "result"},
-            status_code=200
-        )
-
-        result = data_client.find_lot_questions_responses_applicants_for_framework_lot('g-cloud-6', 'g-lot')
+        result = data_client.find_lot_questions_responses(1234, 'g-cloud-6', **kwargs)
 
         assert result == {"lotQuestionsResponses": "result"}
-        assert rmock.called
 
-    def test_find_lot_questions_responses_applicants_for_framework_lot_adds_with_evaluations_parameter(
-        self,
-        data_client,
-        rmock
-    ):
-        rmock.get(
-            "http://baseurl/lot-questions-responses/applications?framework=g-cloud-6&lot=g-lot&with_evaluations=True",
+    @pytest.mark.parametrize("kwargs, qs", (
+        ({}, ""),
+        ({"with_evaluations": True}, "&with_evaluations=True"),
+        ({"page": 2}, "&page=2"),
+    ), ids=[
+        "no_filters",
+        "with_evaluations",
+        "page",
+    ])
+    def test_find_lot_questions_responses_applicants_for_framework_lot(self, data_client, rmock, kwargs, qs):
+        rmock.get(
+            f"http://baseurl/lot-questions-responses/applications?framework=g-cloud-6&lot=g-lot{qs}",
             json={"lotQuestionsResponses": "result"},
             status_code=200
         )
 
-        result = data_client.find_lot_questions_responses_applicants_for_framework_lot(
-            'g-cloud-6',
-            'g-lot',
-            with_evaluations=True
-        )
+        result = data_client.find_lot_questions_responses_applicants_for_framework_lot('g-cloud-6', 'g-lot', **kwargs)
 
         assert result == {"lotQuestionsResponses": "result"}
-        assert rmock.called
-
-    def test_find_lot_questions_responses_applicants_for_framework_lot_adds_page_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/lot-questions-responses/applications?framework=g-cloud-6&lot=g-lot&page=2",
-            json={"lotQuestionsResponses": "result"},
-            status_code=200
-        )
-
-        result = data_client.find_lot_questions_responses_applicants_for_framework_lot('g-cloud-6', 'g-lot', page=2)
-
-        assert result == {"lotQuestionsResponses": "result"}
-        assert rmock.called
 
     def test_create_lot_questions_response(self, data_client, rmock):
         rmock.post(
@@ -4319,7 +3958,6 @@ class TestLotQuestionsResponsesMethods(object):
         result = data_client.create_lot_questions_response(1234, 'g-cloud-6', 'g-lot', "user")
 
         assert result == {'lotQuestionsResponses': {'question': 'answer'}}
-        assert rmock.called
         assert rmock.request_history[0].json() == {
             'supplierId': 1234,
             'frameworkSlug': 'g-cloud-6',
@@ -4336,17 +3974,16 @@ class TestLotQuestionsResponsesMethods(object):
         result = data_client.get_lot_questions_response(1234)
 
         assert result == {"lotQuestionsResponses": "result"}
-        assert rmock.called
 
     def test_get_lot_questions_response_should_return_404(self, data_client, rmock):
         rmock.get(
             "http://baseurl/lot-questions-responses/1234",
             status_code=404)
 
-        try:
+        with pytest.raises(HTTPError):
             data_client.get_lot_questions_response(1234)
-        except HTTPError:
-            assert rmock.called
+
+        assert rmock.called
 
     def test_get_lot_questions_response_with_evaluations(self, data_client, rmock):
         rmock.get(
@@ -4357,7 +3994,6 @@ class TestLotQuestionsResponsesMethods(object):
         result = data_client.get_lot_questions_response(1234, with_evaluations=True)
 
         assert result == {"lotQuestionsResponses": "result"}
-        assert rmock.called
 
     def test_get_lot_questions_response_by_framework_lot_suppler(self, data_client, rmock):
         rmock.get(
@@ -4372,21 +4008,20 @@ class TestLotQuestionsResponsesMethods(object):
         )
 
         assert result == {"lotQuestionsResponses": "result"}
-        assert rmock.called
 
     def test_get_lot_questions_response_by_framework_lot_suppler_should_return_404(self, data_client, rmock):
         rmock.get(
             "http://baseurl/lot-questions-responses/frameworks/g-cloud-6/lots/g-things/suppliers/1234",
             status_code=404)
 
-        try:
+        with pytest.raises(HTTPError):
             data_client.get_lot_questions_response_by_framework_lot_suppler(
                 'g-cloud-6',
                 'g-things',
                 1234
             )
-        except HTTPError:
-            assert rmock.called
+
+        assert rmock.called
 
     def test_update_lot_questions_response(self, data_client, rmock):
         rmock.patch(
@@ -4398,7 +4033,6 @@ class TestLotQuestionsResponsesMethods(object):
         result = data_client.update_lot_questions_response(1234, {"question": "answer"}, "user")
 
         assert result == {'lotQuestionsResponses': {'question': 'answer'}}
-        assert rmock.called
         assert rmock.request_history[0].json() == {
             'updated_by': 'user',
             'lotQuestionsResponses': {'question': 'answer'}
@@ -4419,7 +4053,6 @@ class TestLotQuestionsResponsesMethods(object):
         )
 
         assert result == {'lotQuestionsResponses': {'question': 'answer'}}
-        assert rmock.called
         assert rmock.request_history[0].json() == {
             'updated_by': 'user',
             'lotQuestionsResponses': {'question': 'answer'},
@@ -4435,50 +4068,28 @@ class TestLotQuestionsResponsesMethods(object):
         result = data_client.complete_lot_questions_response(1234, "user")
 
         assert result == {'message': 'done'}
-        assert rmock.called
         assert rmock.request_history[0].json() == {
             'updated_by': 'user',
         }
 
-    def test_find_lot_questions_response_section_evaluations(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/lot-questions-response-section-evaluations?"
-            "framework=g-cloud-6&lot=g-things",
+    @pytest.mark.parametrize("kwargs, qs", (
+        ({}, ""),
+        ({"page": 2}, "&page=2"),
+        ({"section_slug": "the-slug"}, "&section_slug=the-slug"),
+    ), ids=[
+        "no_filters",
+        "page",
+        "section_slug",
+    ])
+    def test_find_lot_questions_response_section_evaluations(self, data_client, rmock, kwargs, qs):
+        rmock.get(
+            f"http://baseurl/lot-questions-response-section-evaluations?framework=g-cloud-6&lot=g-things{qs}",
             json={"lotQuestionsResponseSectionEvaluations": "result"},
             status_code=200)
 
-        result = data_client.find_lot_questions_response_section_evaluations('g-cloud-6', 'g-things')
+        result = data_client.find_lot_questions_response_section_evaluations('g-cloud-6', 'g-things', **kwargs)
 
         assert result == {"lotQuestionsResponseSectionEvaluations": "result"}
-        assert rmock.called
-
-    def ttest_find_lot_questions_response_section_evaluations_adds_page_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/lot-questions-response-section-evaluations?"
-            "framework=g-cloud-6&lot=g-things&page=2",
-            json={"lotQuestionsResponseSectionEvaluations": "result"},
-            status_code=200)
-
-        result = data_client.find_lot_questions_response_section_evaluations('g-cloud-6', 'g-things', page=2)
-
-        assert result == {"lotQuestionsResponseSectionEvaluations": "result"}
-        assert rmock.called
-
-    def test_find_lot_questions_response_section_evaluations_adds_section_slug_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/lot-questions-response-section-evaluations?"
-            "framework=g-cloud-6&lot=g-things&section_slug=the-slug",
-            json={"lotQuestionsResponseSectionEvaluations": "result"},
-            status_code=200)
-
-        result = data_client.find_lot_questions_response_section_evaluations(
-            'g-cloud-6',
-            'g-things',
-            section_slug='the-slug'
-        )
-
-        assert result == {"lotQuestionsResponseSectionEvaluations": "result"}
-        assert rmock.called
 
     def test_get_lot_questions_response_section_evaluation(self, data_client, rmock):
         rmock.get(
@@ -4489,7 +4100,6 @@ class TestLotQuestionsResponsesMethods(object):
         result = data_client.get_lot_questions_response_section_evaluation(1234)
 
         assert result == {"evaluatorFrameworkLotSectionEvaluations": "result"}
-        assert rmock.called
 
     def test_create_lot_questions_response_section_evaluation(self, data_client, rmock):
         rmock.post(
@@ -4513,7 +4123,6 @@ class TestLotQuestionsResponsesMethods(object):
         )
 
         assert result == {'message': 'done'}
-        assert rmock.called
         assert rmock.request_history[0].json() == {
             'lotQuestionsResponseId': 1234,
             'sectionSlug': 'the-slug',
@@ -4545,7 +4154,6 @@ class TestLotQuestionsResponsesMethods(object):
         )
 
         assert result == {'message': 'done'}
-        assert rmock.called
         assert rmock.request_history[0].json() == {
             'lotQuestionsResponseSectionEvaluations': {
                 "comment": "This is the comment",
@@ -4555,146 +4163,105 @@ class TestLotQuestionsResponsesMethods(object):
         }
 
 
-class TestEvaluatorFrameworkLotMethods(object):
-    def test_find_evaluator_framework_lots(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lots?assigned=True",
-            json={"evaluatorFrameworkLots": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lots()
-
-        assert result == {"evaluatorFrameworkLots": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lots_adds_framework_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lots?framework=g-cloud-6&assigned=True",
-            json={"evaluatorFrameworkLots": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lots('g-cloud-6')
-
-        assert result == {"evaluatorFrameworkLots": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lots_adds_lot_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lots?framework=g-cloud-6&lot=g-things&assigned=True",
-            json={"evaluatorFrameworkLots": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lots('g-cloud-6', 'g-things')
-
-        assert result == {"evaluatorFrameworkLots": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lots_adds_page_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lots?framework=g-cloud-6&lot=g-things&assigned=True&page=2",
-            json={"evaluatorFrameworkLots": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lots('g-cloud-6', 'g-things', page=2)
-
-        assert result == {"evaluatorFrameworkLots": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lots_adds_user_id_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lots?"
-            "framework=g-cloud-6&lot=g-things&assigned=True&user_id=1",
-            json={"evaluatorFrameworkLots": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lots('g-cloud-6', 'g-things', user_id=1)
+EVALUATOR_FRAMEWORK_LOTS_URL = "http://baseurl/evaluations/evaluator-framework-lots"
+EVALUATOR_FRAMEWORK_LOT_SECTIONS_URL = "http://baseurl/evaluations/evaluator-framework-lot-sections"
+EVALUATOR_FRAMEWORK_LOT_SECTION_EVALUATIONS_URL = (
+    "http://baseurl/evaluations/evaluator-framework-lot-section-evaluations"
+)
 
-        assert result == {"evaluatorFrameworkLots": "result"}
-        assert rmock.called
 
-    def test_find_evaluator_framework_lots_adds_assigned_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lots?framework=g-cloud-6&lot=g-things&assigned=False",
+class TestEvaluatorFrameworkLotMethods(object):
+    @pytest.mark.parametrize("args, kwargs, qs", (
+        ((), {}, {"assigned": ["true"]}),
+        (('g-cloud-6',), {}, {"framework": ["g-cloud-6"], "assigned": ["true"]}),
+        (('g-cloud-6', 'g-things'), {}, {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["true"]}),
+        (
+            ('g-cloud-6', 'g-things'),
+            {"page": 2},
+            {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["true"], "page": ["2"]},
+        ),
+        (
+            ('g-cloud-6', 'g-things'),
+            {"user_id": 1},
+            {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["true"], "user_id": ["1"]},
+        ),
+        (
+            ('g-cloud-6', 'g-things'),
+            {"assigned": False},
+            {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["false"]},
+        ),
+        (
+            ('g-cloud-6', 'g-things'),
+            {"locked": True},
+            {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["true"], "locked": ["true"]},
+        ),
+        (
+            ('g-cloud-6', 'g-things'),
+            {"with_sections": True},
+            {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["true"], "with_sections": ["true"]},
+        ),
+        (
+            ('g-cloud-6', 'g-things'),
+            {"with_evaluations": True},
+            {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["true"], "with_evaluations": ["true"]},
+        ),
+    ), ids=[
+        "no_filters",
+        "framework",
+        "framework_and_lot",
+        "page",
+        "user_id",
+        "unassigned",
+        "locked",
+        "with_sections",
+        "with_evaluations",
+    ])
+    def test_find_evaluator_framework_lots(self, data_client, rmock, args, kwargs, qs):
+        rmock.get(
+            EVALUATOR_FRAMEWORK_LOTS_URL,
+            complete_qs=False,
             json={"evaluatorFrameworkLots": "result"},
             status_code=200)
 
-        result = data_client.find_evaluator_framework_lots('g-cloud-6', 'g-things', assigned=False)
+        result = data_client.find_evaluator_framework_lots(*args, **kwargs)
 
         assert result == {"evaluatorFrameworkLots": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lot_adds_locked_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lots?"
-            "framework=g-cloud-6&lot=g-things&assigned=True&locked=True",
-            json={"evaluatorFrameworkLotSections": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lots('g-cloud-6', 'g-things', locked=True)
-
-        assert result == {"evaluatorFrameworkLotSections": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lot_adds_with_sections_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lots?"
-            "framework=g-cloud-6&lot=g-things&assigned=True&with_sections=True",
-            json={"evaluatorFrameworkLotSections": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lots('g-cloud-6', 'g-things', with_sections=True)
-
-        assert result == {"evaluatorFrameworkLotSections": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lot_adds_with_evaluations_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lots?"
-            "framework=g-cloud-6&lot=g-things&assigned=True&with_evaluations=True",
-            json={"evaluatorFrameworkLotSections": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lots('g-cloud-6', 'g-things', with_evaluations=True)
-
-        assert result == {"evaluatorFrameworkLotSections": "result"}
-        assert rmock.called
+        # requests_mock lower-cases query string values unless the mocker is case sensitive
+        assert rmock.last_request.qs == qs
 
     def test_get_evaluator_framework_lot(self, data_client, rmock):
         rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lots/1234?with_sections=True&with_evaluations=True",
+            f"{EVALUATOR_FRAMEWORK_LOTS_URL}/1234?with_sections=True&with_evaluations=True",
             json={"evaluatorFrameworkLots": "result"},
             status_code=200)
 
         result = data_client.get_evaluator_framework_lot(1234)
 
         assert result == {"evaluatorFrameworkLots": "result"}
-        assert rmock.called
 
     def test_get_evaluator_framework_lot_adds_with_sections_parameter(self, data_client, rmock):
         rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lots/1234?with_sections=False&with_evaluations=True",
+            f"{EVALUATOR_FRAMEWORK_LOTS_URL}/1234?with_sections=False&with_evaluations=True",
             json={"evaluatorFrameworkLots": "result"},
             status_code=200)
 
         result = data_client.get_evaluator_framework_lot(1234, with_sections=False)
 
         assert result == {"evaluatorFrameworkLots": "result"}
-        assert rmock.called
 
     def test_get_evaluator_framework_lot_adds_with_evaluations_parameter(self, data_client, rmock):
         rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lots/1234?with_sections=True&with_evaluations=False",
+            f"{EVALUATOR_FRAMEWORK_LOTS_URL}/1234?with_sections=True&with_evaluations=False",
             json={"evaluatorFrameworkLots": "result"},
             status_code=200)
 
         result = data_client.get_evaluator_framework_lot(1234, with_evaluations=False)
 
         assert result == {"evaluatorFrameworkLots": "result"}
-        assert rmock.called
 
     def test_update_assigned_evaluators_for_framework_lot(self, data_client, rmock):
         rmock.post(
-            "http://baseurl/evaluations/evaluator-framework-lots",
+            EVALUATOR_FRAMEWORK_LOTS_URL,
             json={"message": "done"},
             status_code=200
         )
@@ -4710,7 +4277,6 @@ class TestEvaluatorFrameworkLotMethods(object):
         )
 
         assert result == {'message': 'done'}
-        assert rmock.called
         assert rmock.request_history[0].json() == {
             'evaluatorFrameworkLots': {
                 'frameworkSlug': 'g-cloud-6',
@@ -4725,7 +4291,7 @@ class TestEvaluatorFrameworkLotMethods(object):
 
     def test_update_evaluator_framework_lot_status(self, data_client, rmock):
         rmock.post(
-            "http://baseurl/evaluations/evaluator-framework-lots/1234/status/locked",
+            f"{EVALUATOR_FRAMEWORK_LOTS_URL}/1234/status/locked",
             json={"message": "done"},
             status_code=200
         )
@@ -4737,86 +4303,46 @@ class TestEvaluatorFrameworkLotMethods(object):
         )
 
         assert result == {'message': 'done'}
-        assert rmock.called
         assert rmock.request_history[0].json() == {
             'updated_by': 'user',
         }
 
-    def test_find_evaluator_framework_lot_sections(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-sections?"
-            "framework=g-cloud-6&lot=g-things&assigned=True",
-            json={"evaluatorFrameworkLotSections": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lot_sections('g-cloud-6', 'g-things')
-
-        assert result == {"evaluatorFrameworkLotSections": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lot_sections_adds_page_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-sections?"
-            "framework=g-cloud-6&lot=g-things&assigned=True&page=2",
-            json={"evaluatorFrameworkLotSections": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lot_sections('g-cloud-6', 'g-things', page=2)
-
-        assert result == {"evaluatorFrameworkLotSections": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lot_sections_adds_section_slug_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-sections?"
-            "framework=g-cloud-6&lot=g-things&assigned=True&section_slug=the-slug",
-            json={"evaluatorFrameworkLotSections": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lot_sections('g-cloud-6', 'g-things', section_slug='the-slug')
-
-        assert result == {"evaluatorFrameworkLotSections": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lot_sections_adds_assigned_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-sections?"
-            "framework=g-cloud-6&lot=g-things&assigned=False",
-            json={"evaluatorFrameworkLotSections": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lot_sections('g-cloud-6', 'g-things', assigned=False)
-
-        assert result == {"evaluatorFrameworkLotSections": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lot_sections_adds_locked_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-sections?"
-            "framework=g-cloud-6&lot=g-things&assigned=True&locked=True",
-            json={"evaluatorFrameworkLotSections": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lot_sections('g-cloud-6', 'g-things', locked=True)
-
-        assert result == {"evaluatorFrameworkLotSections": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lot_sections_adds_with_evaluations_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-sections?"
-            "framework=g-cloud-6&lot=g-things&assigned=True&with_evaluations=True",
+    @pytest.mark.parametrize("kwargs, qs", (
+        ({}, {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["true"]}),
+        ({"page": 2}, {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["true"], "page": ["2"]}),
+        (
+            {"section_slug": "the-slug"},
+            {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["true"], "section_slug": ["the-slug"]},
+        ),
+        ({"assigned": False}, {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["false"]}),
+        ({"locked": True}, {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["true"], "locked": ["true"]}),
+        (
+            {"with_evaluations": True},
+            {"framework": ["g-cloud-6"], "lot": ["g-things"], "assigned": ["true"], "with_evaluations": ["true"]},
+        ),
+    ), ids=[
+        "no_filters",
+        "page",
+        "section_slug",
+        "unassigned",
+        "locked",
+        "with_evaluations",
+    ])
+    def test_find_evaluator_framework_lot_sections(self, data_client, rmock, kwargs, qs):
+        rmock.get(
+            EVALUATOR_FRAMEWORK_LOT_SECTIONS_URL,
+            complete_qs=False,
             json={"evaluatorFrameworkLotSections": "result"},
             status_code=200)
 
-        result = data_client.find_evaluator_framework_lot_sections('g-cloud-6', 'g-things', with_evaluations=True)
+        result = data_client.find_evaluator_framework_lot_sections('g-cloud-6', 'g-things', **kwargs)
 
         assert result == {"evaluatorFrameworkLotSections": "result"}
-        assert rmock.called
+        assert rmock.last_request.qs == qs
 
     def test_update_assigned_sections_for_evaluator_framework_lot(self, data_client, rmock):
         rmock.post(
-            "http://baseurl/evaluations/evaluator-framework-lot-sections",
+            EVALUATOR_FRAMEWORK_LOT_SECTIONS_URL,
             json={"message": "done"},
             status_code=200
         )
@@ -4833,7 +4359,6 @@ class TestEvaluatorFrameworkLotMethods(object):
         )
 
         assert result == {'message': 'done'}
-        assert rmock.called
         assert rmock.request_history[0].json() == {
             'evaluatorFrameworkLotSections': {
                 'evaluatorFrameworkLots': [
@@ -4849,101 +4374,50 @@ class TestEvaluatorFrameworkLotMethods(object):
 
     def test_get_evaluator_framework_lot_section(self, data_client, rmock):
         rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-sections/1234?with_evaluations=True",
+            f"{EVALUATOR_FRAMEWORK_LOT_SECTIONS_URL}/1234?with_evaluations=True",
             json={"evaluatorFrameworkLotSections": "result"},
             status_code=200)
 
         result = data_client.get_evaluator_framework_lot_section(1234)
 
         assert result == {"evaluatorFrameworkLotSections": "result"}
-        assert rmock.called
 
     def test_get_evaluator_framework_lot_section_adds_with_evaluations_parameter(self, data_client, rmock):
         rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-sections/1234?with_evaluations=False",
+            f"{EVALUATOR_FRAMEWORK_LOT_SECTIONS_URL}/1234?with_evaluations=False",
             json={"evaluatorFrameworkLotSections": "result"},
             status_code=200)
 
         result = data_client.get_evaluator_framework_lot_section(1234, with_evaluations=False)
 
         assert result == {"evaluatorFrameworkLotSections": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lot_section_evaluations(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-section-evaluations?"
-            "framework=g-cloud-6&lot=g-things",
-            json={"evaluatorFrameworkLotSectionEvaluations": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lot_section_evaluations('g-cloud-6', 'g-things')
-
-        assert result == {"evaluatorFrameworkLotSectionEvaluations": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lot_section_evaluations_adds_page_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-section-evaluations?"
-            "framework=g-cloud-6&lot=g-things&page=2",
-            json={"evaluatorFrameworkLotSectionEvaluations": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lot_section_evaluations('g-cloud-6', 'g-things', page=2)
-
-        assert result == {"evaluatorFrameworkLotSectionEvaluations": "result"}
-        assert rmock.called
 
-    def test_find_evaluator_framework_lot_section_evaluations_adds_section_slug_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-section-evaluations?"
-            "framework=g-cloud-6&lot=g-things&section_slug=the-slug",
+    @pytest.mark.parametrize("kwargs, qs", (
+        ({}, ""),
+        ({"page": 2}, "&page=2"),
+        ({"section_slug": "the-slug"}, "&section_slug=the-slug"),
+        ({"evaluator_framework_lot_id": 1234}, "&evaluator_framework_lot_id=1234"),
+        ({"supplier_id": 123}, "&supplier_id=123"),
+    ), ids=[
+        "no_filters",
+        "page",
+        "section_slug",
+        "evaluator_framework_lot_id",
+        "supplier_id",
+    ])
+    def test_find_evaluator_framework_lot_section_evaluations(self, data_client, rmock, kwargs, qs):
+        rmock.get(
+            f"{EVALUATOR_FRAMEWORK_LOT_SECTION_EVALUATIONS_URL}?framework=g-cloud-6&lot=g-things{qs}",
             json={"evaluatorFrameworkLotSectionEvaluations": "result"},
             status_code=200)
 
-        result = data_client.find_evaluator_framework_lot_section_evaluations(
-            'g-cloud-6',
-            'g-things',
-            section_slug='the-slug'
-        )
+        result = data_client.find_evaluator_framework_lot_section_evaluations('g-cloud-6', 'g-things', **kwargs)
 
         assert result == {"evaluatorFrameworkLotSectionEvaluations": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lot_section_evaluations_adds_evaluator_framework_lot_id_parameter(
-        self,
-        data_client,
-        rmock
-    ):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-section-evaluations?"
-            "framework=g-cloud-6&lot=g-things&evaluator_framework_lot_id=1234",
-            json={"evaluatorFrameworkLotSectionEvaluations": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lot_section_evaluations(
-            'g-cloud-6',
-            'g-things',
-            evaluator_framework_lot_id=1234
-        )
-
-        assert result == {"evaluatorFrameworkLotSectionEvaluations": "result"}
-        assert rmock.called
-
-    def test_find_evaluator_framework_lot_section_evaluations_adds_supplier_id_parameter(self, data_client, rmock):
-        rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-section-evaluations?"
-            "framework=g-cloud-6&lot=g-things&supplier_id=123",
-            json={"evaluatorFrameworkLotSectionEvaluations": "result"},
-            status_code=200)
-
-        result = data_client.find_evaluator_framework_lot_section_evaluations('g-cloud-6', 'g-things', supplier_id=123)
-
-        assert result == {"evaluatorFrameworkLotSectionEvaluations": "result"}
-        assert rmock.called
 
     def test_create_evaluator_framework_lot_section_evaluation(self, data_client, rmock):
         rmock.post(
-            "http://baseurl/evaluations/evaluator-framework-lot-section-evaluations",
+            EVALUATOR_FRAMEWORK_LOT_SECTION_EVALUATIONS_URL,
             json={"message": "done"},
             status_code=200
         )
@@ -4963,7 +4437,6 @@ class TestEvaluatorFrameworkLotMethods(object):
         )
 
         assert result == {'message': 'done'}
-        assert rmock.called
         assert rmock.request_history[0].json() == {
             'evaluatorFrameworkLotSectionId': 1234,
             'supplierId': 5678,
@@ -4980,30 +4453,27 @@ class TestEvaluatorFrameworkLotMethods(object):
 
     def test_get_evaluator_framework_lot_section_evaluation(self, data_client, rmock):
         rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-section-evaluations/1234",
+            f"{EVALUATOR_FRAMEWORK_LOT_SECTION_EVALUATIONS_URL}/1234",
             json={"evaluatorFrameworkLotSectionEvaluations": "result"},
             status_code=200)
 
         result = data_client.get_evaluator_framework_lot_section_evaluation(1234)
 
         assert result == {"evaluatorFrameworkLotSectionEvaluations": "result"}
-        assert rmock.called
 
     def test_get_evaluator_framework_lot_section_evaluation_with_lot_questions_response(self, data_client, rmock):
         rmock.get(
-            "http://baseurl/evaluations/evaluator-framework-lot-section-evaluations/1234"
-            "?with_lot_questions_response=True",
+            f"{EVALUATOR_FRAMEWORK_LOT_SECTION_EVALUATIONS_URL}/1234?with_lot_questions_response=True",
             json={"evaluatorFrameworkLotSectionEvaluations": "result"},
             status_code=200)
 
         result = data_client.get_evaluator_framework_lot_section_evaluation(1234, with_lot_questions_response=True)
 
         assert result == {"evaluatorFrameworkLotSectionEvaluations": "result"}
-        assert rmock.called
 
     def test_update_evaluator_framework_lot_section_evaluation(self, data_client, rmock):
         rmock.post(
-            "http://baseurl/evaluations/evaluator-framework-lot-section-evaluations/1234",
+            f"{EVALUATOR_FRAMEWORK_LOT_SECTION_EVALUATIONS_URL}/1234",
             json={"message": "done"},
             status_code=200
         )
@@ -5018,7 +4488,6 @@ class TestEvaluatorFrameworkLotMethods(object):
         )
 
         assert result == {'message': 'done'}
-        assert rmock.called
         assert rmock.request_history[0].json() == {
             'evaluatorFrameworkLotSectionEvaluations': {
                 "comment": "This is the comment",
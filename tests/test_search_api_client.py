@@ -3,7 +3,7 @@ import os
 
 from flask import json
 import pytest
-import mock
+from types import SimpleNamespace
 
 from dmapiclient import SearchAPIClient
 from dmapiclient import APIError, HTTPError
@@ -16,12 +16,11 @@ def search_client():
 
 class TestSearchApiClient(object):
     def test_init_app_sets_attributes(self, search_client):
-        app = mock.Mock()
-        app.config = {
+        app = SimpleNamespace(config={
             "DM_SEARCH_API_URL": "http://example",
             "DM_SEARCH_API_AUTH_TOKEN": "example-token",
             "ES_ENABLED": False,
-        }
+        })
         search_client.init_app(app)
 
         assert search_client.base_url == "http://example"
@@ -176,11 +175,12 @@ class TestSearchApiClient(object):
 
     def test_should_raise_error_on_failure(
             self, search_client, rmock):
+        rmock.put(
+            'http://baseurl/g-cloud/services/12345',
+            json={'error': 'some error'},
+            status_code=400)
+
         with pytest.raises(APIError):
-            rmock.put(
-                'http://baseurl/g-cloud/services/12345',
-                json={'error': 'some error'},
-                status_code=400)
             search_client.index(
                 index_name='g-cloud',
                 object_id="12345",